@@ -1,10 +1,22 @@
 import unittest
 import os
+from unittest import mock
+import search4
 from parser import parse_dimacs_graph
 from search import search_max_clique
 from search2 import search_max_clique as search2_max_clique
 from search4 import search_max_clique as search3_max_clique
 from search3 import search_max_clique as search4_max_clique
+from search5 import search_max_clique as search5_max_clique
+from search6 import search_max_clique as search6_max_clique
+from search7 import search_max_clique as search7_max_clique
+from portfolio import run_portfolio
+from selector import search_max_clique as auto_max_clique
+from estimate import estimate
+from generator import generate
+from timeTest import run_version
+import main
+from main import graph_files, solve
 
 DIMACS_FOLDER = "../DIMACS"
 TEST_FILE_1 = "johnson8-2-4.clq"  # Smallest instance
@@ -13,6 +25,8 @@ TEST_FILE_2 = "p_hat300-1.clq"
 SOL_MAX_CLIQUE_SIZE_2 = 8
 TEST_FILE_3 = "brock200_2.clq"
 SOL_MAX_CLIQUE_SIZE_3 = 12
+TEST_FILE_4 = "MANN_a9.clq"       # Dense instance (complement route in search5)
+SOL_MAX_CLIQUE_SIZE_4 = 16
 
 
 def build_graph(filename):
@@ -52,6 +66,32 @@ class Test(unittest.TestCase):
         result = search4_max_clique(graph)
         self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_1)
 
+    def test_johnson_search4_symmetry(self):
+        print(f"Testing {TEST_FILE_1} with search4.py (symmetry breaking)")
+        graph = build_graph(TEST_FILE_1)
+        # Small graph: compute orbits straight away so the pruning is exercised
+        with mock.patch.object(search4, "SYMMETRY_MIN_NODES", 0):
+            result = search3_max_clique(graph, symmetry=True)  # alias of search4 (see imports)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_1)
+
+    def test_johnson_search5(self):
+        print(f"Testing {TEST_FILE_1} with search5.py")
+        graph = build_graph(TEST_FILE_1)
+        result = search5_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_1)
+
+    def test_johnson_search6(self):
+        print(f"Testing {TEST_FILE_1} with search6.py")
+        graph = build_graph(TEST_FILE_1)
+        result = search6_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_1)
+
+    def test_johnson_search7(self):
+        print(f"Testing {TEST_FILE_1} with search7.py")
+        graph = build_graph(TEST_FILE_1)
+        result = search7_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_1)
+
 
     def test_phat_search(self):
         print(f"Testing {TEST_FILE_2} with search.py")
@@ -77,6 +117,24 @@ class Test(unittest.TestCase):
         result = search4_max_clique(graph)
         self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_2)
 
+    def test_phat_search5(self):
+        print(f"Testing {TEST_FILE_2} with search5.py")
+        graph = build_graph(TEST_FILE_2)
+        result = search5_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_2)
+
+    def test_phat_search6(self):
+        print(f"Testing {TEST_FILE_2} with search6.py")
+        graph = build_graph(TEST_FILE_2)
+        result = search6_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_2)
+
+    def test_phat_search7(self):
+        print(f"Testing {TEST_FILE_2} with search7.py")
+        graph = build_graph(TEST_FILE_2)
+        result = search7_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_2)
+
 
     def test_brook_search(self):
         print(f"Testing {TEST_FILE_3} with search.py")
@@ -102,6 +160,101 @@ class Test(unittest.TestCase):
         graph = build_graph(TEST_FILE_3)
         result = search4_max_clique(graph)
         self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+    def test_brook_search4_symmetry(self):
+        print(f"Testing {TEST_FILE_3} with search4.py (symmetry breaking)")
+        graph = build_graph(TEST_FILE_3)
+        result = search3_max_clique(graph, symmetry=True)  # alias of search4 (see imports)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+    def test_brook_search5(self):
+        print(f"Testing {TEST_FILE_3} with search5.py")
+        graph = build_graph(TEST_FILE_3)
+        result = search5_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+    def test_brook_search6(self):
+        print(f"Testing {TEST_FILE_3} with search6.py")
+        graph = build_graph(TEST_FILE_3)
+        result = search6_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+    def test_brook_search7(self):
+        print(f"Testing {TEST_FILE_3} with search7.py")
+        graph = build_graph(TEST_FILE_3)
+        result = search7_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+
+    def test_mann_search5(self):
+        print(f"Testing {TEST_FILE_4} with search5.py")
+        graph = build_graph(TEST_FILE_4)
+        result = search5_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_4)
+
+
+    def test_brook_auto(self):
+        print(f"Testing {TEST_FILE_3} with selector.py (auto)")
+        graph = build_graph(TEST_FILE_3)
+        result = auto_max_clique(graph)
+        self.assertEqual(len(result), SOL_MAX_CLIQUE_SIZE_3)
+
+    def test_mann_estimate(self):
+        print(f"Testing {TEST_FILE_4} with estimate.py")
+        graph = build_graph(TEST_FILE_4)
+        exact = estimate(graph)  # small enough for the budgeted search4 run to finish
+        self.assertTrue(exact["exact"])
+        self.assertEqual(exact["incumbent"], SOL_MAX_CLIQUE_SIZE_4)
+        est = estimate(graph, probes=50, incumbent_nodes=0)  # dives only
+        self.assertFalse(est["exact"])
+        self.assertEqual(est["probes"], 50)
+        self.assertLessEqual(est["nodes_ci"][0], est["nodes"])
+        self.assertLessEqual(est["nodes"], est["nodes_ci"][1])
+        self.assertGreaterEqual(est["incumbent"], SOL_MAX_CLIQUE_SIZE_4 - 4)
+
+    def test_generator_planted(self):
+        print("Testing generator.py (planted clique, reproducible)")
+        edges = generate("planted", 60, p=0.2, k=10, seed=3)
+        self.assertEqual(edges, generate("planted", 60, p=0.2, k=10, seed=3))
+        graph = {i: set() for i in range(1, 61)}
+        for u, v in edges:
+            graph[u].add(v)
+            graph[v].add(u)
+        self.assertGreaterEqual(len(search3_max_clique(graph)), 10)  # alias of search4
+
+    def test_phat_portfolio(self):
+        print(f"Testing {TEST_FILE_2} with portfolio.py")
+        graph = build_graph(TEST_FILE_2)
+        report = run_portfolio(graph)
+        self.assertTrue(report["optimal"])
+        self.assertEqual(len(report["clique"]), SOL_MAX_CLIQUE_SIZE_2)
+
+    def test_johnson_memory(self):
+        print(f"Testing {TEST_FILE_1} with timeTest.run_version (memory)")
+        graph = build_graph(TEST_FILE_1)
+        t, size, memory = run_version("search4", graph, timeout=60, memory_budget=500)
+        self.assertEqual(size, SOL_MAX_CLIQUE_SIZE_1)
+        self.assertGreater(memory["peak_rss_mb"], 0)
+        self.assertNotIn("nodes", memory)  # the timed run is not instrumented
+        t, size, memory = run_version("search4", graph, timeout=60, trace=True)
+        self.assertGreater(memory["nodes"], 0)
+        self.assertGreater(memory["peak_rss_mb"], 0)
+        self.assertIn("search4.py", memory["top_allocations"])
+
+    def test_cli_bench_options(self):
+        print("Testing main.py bench forwards timeTest options")
+        for args in (["--estimate"], ["--trace-malloc", "brock200_2.clq"],
+                     ["--memory-budget", "2000"], ["brock200_2.clq", "--estimate"]):
+            with mock.patch.object(main, "bench") as bench:
+                main.main(["bench"] + args)
+            bench.assert_called_once_with(args)
+
+    def test_cli_batch_solve(self):
+        print("Testing main.py solve on a glob with 2 processes")
+        files = graph_files(["johnson8-*.clq"])
+        self.assertEqual(len(files), 2)
+        reports = solve(files, "search7", jobs=2)
+        self.assertEqual(len(reports[0]["clique"]), SOL_MAX_CLIQUE_SIZE_1)  # johnson8-2-4
     
 
 if __name__ == "__main__":
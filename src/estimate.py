@@ -0,0 +1,204 @@
+"""
+Search tree size and runtime estimation for search4 (before solving).
+Knuth's estimator: random root-to-leaf dives through the real search4 tree (same greedy
+colouring bound, same branching order); along each dive, the product of the branching
+factors estimates the number of nodes on that level.
+Estimating the Efficiency of Backtrack Programs — Donald E. Knuth, 1975.
+https://doi.org/10.1090/S0025-5718-1975-0373371-6
+"""
+# search4 prunes against the best clique found so far, which the dives can't know. So
+# we first run search4 itself for up to INCUMBENT_NODES nodes. Graphs it finishes get
+# their exact count and time. On the others its clique (or search6's greedy clique,
+# whichever is bigger) is the incumbent for the dives, and those first nodes and
+# seconds are added on top.
+# The same dives also estimate time: each node's measured cost is weighted like its count.
+# The confidence interval only covers the sampling noise of the dives. Any bias from the
+# fixed incumbent is not in it, so the real count can fall outside.
+
+import math
+import os
+import random
+import sys
+import time
+from parser import parse_dimacs_graph
+import search4
+from search4 import greedy_colouring_bound
+from search6 import csr_from_adjacency, core_decomposition, greedy_clique
+
+PROBES = 200          # default number of dives
+INCUMBENT_NODES = 2000  # search4 nodes spent on finding the incumbent first
+BUDGET_SECONDS = 5.0  # default time limit for all the dives together
+Z_95 = 1.96
+DIMACS_FOLDER = "../DIMACS"
+
+def load_graph(file_name):
+    """Reads the DIMACS file and builds the graph"""
+    path = os.path.join(DIMACS_FOLDER, file_name)
+    num_vertices, edges = parse_dimacs_graph(path)
+    graph = {i: set() for i in range(1, num_vertices + 1)}
+    for u, v in edges:
+        graph[u].add(v)
+        graph[v].add(u)
+    return graph
+
+class _BudgetSpent(Exception):
+    pass
+
+class _NodeBudget:
+    """
+    shared= hook for search4 (same calls as portfolio.SharedIncumbent): keeps the best
+    clique it is offered and stops the search after 'nodes' search nodes.
+    """
+
+    def __init__(self, nodes):
+        self.left = nodes
+        self.used = 0
+        self.clique = []
+
+    def poll(self):
+        if self.used >= self.left:
+            raise _BudgetSpent()
+        self.used += 1
+        return 0
+
+    def offer(self, clique):
+        if len(clique) > len(self.clique):
+            self.clique = list(clique)
+
+    def best(self):
+        return self.clique
+
+def _incumbent_run(graph, nodes):
+    """
+    search4 for at most 'nodes' nodes.
+    Returns (best clique size, nodes used, seconds, finished).
+    """
+    budget = _NodeBudget(nodes)
+    start = time.perf_counter()
+    try:
+        budget.offer(search4.search_max_clique(graph, shared=budget))
+        finished = True
+    except _BudgetSpent:
+        finished = False
+    return len(budget.clique), budget.used, time.perf_counter() - start, finished
+
+def _probe(graph, deg, best, rng):
+    """
+    One random dive from the root of the search4 tree.
+    Returns (estimated nodes, estimated seconds, biggest clique size seen).
+    """
+    cands = set(graph)
+    depth = 0
+    weight = 1.0  # number of nodes on this level, as seen from this dive
+    nodes, seconds = 0.0, 0.0
+    found = 0
+
+    while True:
+        start = time.perf_counter()
+        order, bound = greedy_colouring_bound(graph, deg, cands)
+
+        # The children search4 would expand (same loop, same pruning)
+        children = []
+        remaining = set(cands)
+        for i in range(len(order) - 1, -1, -1):
+            if depth + bound[i] <= best:
+                break
+            vertex = order[i]
+            new_cands = remaining & graph[vertex]
+            if new_cands:
+                children.append(new_cands)
+            else:
+                found = max(found, depth + 1)  # leaf: a maximal clique
+            remaining.discard(vertex)
+
+        seconds += weight * (time.perf_counter() - start)
+        nodes += weight
+        if not children:
+            return nodes, seconds, found
+
+        cands = rng.choice(children)
+        weight *= len(children)
+        depth += 1
+
+def _interval(samples):
+    """Mean and 95% confidence interval (normal approximation, clipped at 0)."""
+    k = len(samples)
+    mean = sum(samples) / k
+    if k < 2:
+        return mean, (0.0, math.inf)
+    std = math.sqrt(sum((x - mean) ** 2 for x in samples) / (k - 1))
+    half = Z_95 * std / math.sqrt(k)
+    return mean, (max(mean - half, 0.0), mean + half)
+
+def estimate(graph, probes=PROBES, budget=BUDGET_SECONDS, seed=0, incumbent_nodes=INCUMBENT_NODES):
+    """
+    Predicts search4's node count and wall time on this graph.
+    Runs search4 for up to 'incumbent_nodes' nodes first (exact answer if it finishes),
+    then up to 'probes' dives, stopping early after 'budget' seconds (at least 2 dives).
+    Returns a dict with "nodes", "nodes_ci", "seconds", "seconds_ci", "probes",
+    "incumbent" and "exact". The intervals are sampling-only (see the note at the top).
+    """
+    rng = random.Random(seed)
+    deg = {v: len(graph[v]) for v in graph}
+    start = time.time()
+
+    best, used, used_seconds, finished = _incumbent_run(graph, incumbent_nodes)
+    if finished:
+        return {
+            "nodes": used,
+            "nodes_ci": (used, used),
+            "seconds": used_seconds,
+            "seconds_ci": (used_seconds, used_seconds),
+            "probes": 0,
+            "incumbent": best,
+            "exact": True,
+            "sampling_time": time.time() - start,
+        }
+    labels, offsets, targets = csr_from_adjacency(graph)
+    core, order = core_decomposition(len(labels), offsets, targets)
+    best = max(best, len(greedy_clique(len(labels), offsets, targets, core, order)))
+
+    node_samples, time_samples = [], []
+    while len(node_samples) < probes:
+        if len(node_samples) >= 2 and time.time() - start > budget:
+            break
+        nodes, seconds, found = _probe(graph, deg, best, rng)
+        node_samples.append(used + nodes)
+        time_samples.append(used_seconds + seconds)
+        best = max(best, found)
+
+    nodes, nodes_ci = _interval(node_samples)
+    seconds, seconds_ci = _interval(time_samples)
+    return {
+        "nodes": nodes,
+        "nodes_ci": nodes_ci,
+        "seconds": seconds,
+        "seconds_ci": seconds_ci,
+        "probes": len(node_samples),
+        "incumbent": best,
+        "exact": False,
+        "sampling_time": time.time() - start,
+    }
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python estimate.py <graph_file> [probes]")
+        print("Example: python estimate.py brock200_4.clq 500")
+        sys.exit(1)
+
+    file_name = sys.argv[1]
+    probes = int(sys.argv[2]) if len(sys.argv) > 2 else PROBES
+    graph = load_graph(file_name)
+    est = estimate(graph, probes=probes)
+
+    if est["exact"]:
+        print(f"==> {file_name}: search4 finished within {INCUMBENT_NODES} nodes (exact)")
+        print(f"==> Nodes: {est['nodes']}, time: {est['seconds']:.3g} s, max clique {est['incumbent']}")
+        return
+    print(f"==> {file_name}: {est['probes']} probes in {est['sampling_time']:.2f} s "
+          f"(incumbent {est['incumbent']})")
+    print(f"==> Nodes: {est['nodes']:.3g}  (95% sampling CI {est['nodes_ci'][0]:.3g} - {est['nodes_ci'][1]:.3g})")
+    print(f"==> Time:  {est['seconds']:.3g} s (95% sampling CI {est['seconds_ci'][0]:.3g} - {est['seconds_ci'][1]:.3g} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Reproducible synthetic DIMACS instances for scaling benchmarks.
+Families: G(n,p), brock-style hidden cliques, planted cliques, p_hat-style degree spread
+and sparse power-law graphs. The same parameters and seed always give the same file.
+Sweeps go to DIMACS/synthetic/<name>/ with a manifest.csv, and timeTest.py can run that
+folder directly; scaling_plots() then draws time vs n / density per solver.
+"""
+
+import argparse
+import csv
+import itertools
+import math
+import os
+import random
+
+DIMACS_FOLDER = "../DIMACS"
+SYNTHETIC_FOLDER = "synthetic"  # inside DIMACS_FOLDER
+RESULTS_FILE = "results.csv"
+PLOTS_DIR = "plots"
+FAMILIES = ["gnp", "brock", "planted", "phat", "powerlaw"]
+
+# ---------- Generators (all return a set of edges (u, v), u < v, vertices 1..n) ----------
+
+def gnp(n, p, rng):
+    """Erdos-Renyi G(n,p), skipping over non-edges geometrically (Batagelj-Brandes)."""
+    edges = set()
+    if p <= 0:
+        return edges
+    if p >= 1:
+        return {(u, v) for u in range(1, n + 1) for v in range(u + 1, n + 1)}
+    log_q = math.log(1 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            edges.add((w + 1, v + 1))
+    return edges
+
+def planted(n, p, k, rng):
+    """G(n,p) with a clique on k random vertices."""
+    edges = gnp(n, p, rng)
+    clique = sorted(rng.sample(range(1, n + 1), k))
+    for i, u in enumerate(clique):
+        for v in clique[i + 1:]:
+            edges.add((u, v))
+    return edges
+
+def brock(n, p, k, rng):
+    """
+    Hidden clique in the style of Brockington & Culberson: a planted k-clique whose
+    vertices lose edges to the rest so their expected degree matches everyone else's.
+    """
+    clique = set(rng.sample(range(1, n + 1), k))
+    # Clique vertex: (k - 1) + keep * (n - k) should equal p * (n - 1)
+    keep = max(0.0, min(1.0, (p * (n - 1) - (k - 1)) / (n - k))) if n > k else 0.0
+    edges = set()
+    for u in range(1, n + 1):
+        for v in range(u + 1, n + 1):
+            inside = (u in clique) + (v in clique)
+            if inside == 2:
+                edges.add((u, v))
+            elif rng.random() < (keep if inside == 1 else p):
+                edges.add((u, v))
+    return edges
+
+def phat(n, p, spread, rng):
+    """
+    p_hat-style: each vertex gets its own density a_v, uniform in p*(1 -/+ spread),
+    and u-v is an edge with probability (a_u + a_v) / 2. Wider spread, wider degrees.
+    """
+    a = [0.0] + [min(1.0, max(0.0, rng.uniform(p * (1 - spread), p * (1 + spread))))
+                 for _ in range(n)]
+    return {(u, v) for u in range(1, n + 1) for v in range(u + 1, n + 1)
+            if rng.random() < (a[u] + a[v]) / 2}
+
+def powerlaw(n, avg_degree, gamma, rng):
+    """
+    Sparse power-law graph (Chung-Lu style): about n * avg_degree / 2 edges with endpoints
+    drawn proportionally to weights i^(-1/(gamma-1)). O(n + m log n), so fine for large n.
+    """
+    weights = [(i + 1) ** (-1.0 / (gamma - 1)) for i in range(n)]
+    cum_weights = list(itertools.accumulate(weights))  # once, not on every draw
+    order = list(range(1, n + 1))
+    rng.shuffle(order)  # hubs are not always the low ids
+    target = int(n * avg_degree / 2)
+    edges = set()
+    tries = 0
+    while len(edges) < target and tries < 10 * target:
+        tries += 1
+        u, v = rng.choices(order, cum_weights=cum_weights, k=2)
+        if u != v:
+            edges.add((min(u, v), max(u, v)))
+    return edges
+
+def generate(family, n, p=0.5, k=None, spread=0.5, gamma=2.5, avg_degree=10, seed=0):
+    """Edges for one instance. Parameters a family doesn't use are ignored."""
+    rng = random.Random(f"{family}-{n}-{p}-{k}-{spread}-{gamma}-{avg_degree}-{seed}")
+    if k is None:
+        k = max(2, int(round(math.sqrt(n))))
+    if family == "gnp":
+        return gnp(n, p, rng)
+    if family == "planted":
+        return planted(n, p, k, rng)
+    if family == "brock":
+        return brock(n, p, k, rng)
+    if family == "phat":
+        return phat(n, p, spread, rng)
+    if family == "powerlaw":
+        return powerlaw(n, avg_degree, gamma, rng)
+    raise ValueError(f"Unknown family '{family}' (expected one of {', '.join(FAMILIES)})")
+
+# ---------- Files ----------
+
+def write_dimacs(path, n, edges, comment=""):
+    """Write a graph in DIMACS format (what parse_dimacs_graph reads)."""
+    with open(path, "w") as f:
+        if comment:
+            f.write(f"c {comment}\n")
+        f.write(f"p edge {n} {len(edges)}\n")
+        for u, v in sorted(edges):
+            f.write(f"e {u} {v}\n")
+
+def instance_name(family, n, params, seed):
+    """File name that encodes all the parameters."""
+    parts = [family, f"n{n}"] + [f"{key}{value}" for key, value in params.items()] + [f"s{seed}"]
+    return "_".join(parts) + ".clq"
+
+def sweep(name, family, ns, ps=(0.5,), seeds=(0,), **params):
+    """
+    Generate every (n, p, seed) combination into DIMACS/synthetic/<name>/ plus a
+    manifest.csv (file, family, n, p, seed, density, ...). Returns the folder path.
+    """
+    folder = os.path.join(DIMACS_FOLDER, SYNTHETIC_FOLDER, name)
+    os.makedirs(folder, exist_ok=True)
+    rows = []
+    if family == "powerlaw":
+        ps = (None,)  # density comes from avg_degree instead
+    for n in ns:
+        for p in ps:
+            for seed in seeds:
+                used = dict(params)
+                if family != "powerlaw":
+                    used = {"p": p, **used}
+                file_name = instance_name(family, n, used, seed)
+                edges = generate(family, n, p=p or 0.0, seed=seed, **params)
+                write_dimacs(os.path.join(folder, file_name), n, edges,
+                             f"generator.py {family} n={n} {used} seed={seed}")
+                density = 2 * len(edges) / (n * (n - 1)) if n > 1 else 0.0
+                rows.append({"File": os.path.join(SYNTHETIC_FOLDER, name, file_name),
+                             "family": family, "n": n, "p": p, "seed": seed,
+                             "edges": len(edges), "density": round(density, 4), **params})
+                print(f"[gen] {file_name}: {len(edges)} edges")
+
+    with open(os.path.join(folder, "manifest.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    return folder
+
+# ---------- Scaling curves ----------
+
+def scaling_plots(name, x="n", csv_path=RESULTS_FILE):
+    """
+    Time vs x ("n" or "density") per solver for one sweep, from timeTest's results.csv.
+    Points with the same x are averaged over seeds; timeouts are left out.
+    """
+    import matplotlib.pyplot as plt
+
+    manifest = os.path.join(DIMACS_FOLDER, SYNTHETIC_FOLDER, name, "manifest.csv")
+    with open(manifest, newline="") as f:
+        params = {row["File"]: row for row in csv.DictReader(f)}
+    with open(csv_path, newline="") as f:
+        rows = [r for r in csv.DictReader(f) if r["File"] in params]
+    if not rows:
+        print(f"[plot] No results for sweep '{name}' in {csv_path}; run timeTest.py first.")
+        return
+
+    solvers = [c for c in rows[0].keys() if c != "File"]
+    os.makedirs(PLOTS_DIR, exist_ok=True)
+    plt.figure()
+    for solver in solvers:
+        points = {}
+        for r in rows:
+            try:
+                t = float(r[solver])
+            except (TypeError, ValueError):
+                continue
+            points.setdefault(float(params[r["File"]][x]), []).append(t)
+        if points:
+            xs = sorted(points)
+            plt.plot(xs, [sum(points[v]) / len(points[v]) for v in xs], marker="o", label=solver)
+    plt.yscale("log")
+    plt.xlabel(x)
+    plt.ylabel("Time (s)")
+    plt.title(f"Scaling — {name}")
+    plt.legend()
+    plt.tight_layout()
+    out_path = os.path.join(PLOTS_DIR, f"Scaling_{name}_{x}.png")
+    plt.savefig(out_path, dpi=150)
+    plt.close()
+    print(f"[plot] Saved {out_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproducible synthetic DIMACS instances.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("sweep", help="generate a parameter sweep")
+    gen.add_argument("name", help="sweep name (folder under DIMACS/synthetic)")
+    gen.add_argument("family", choices=FAMILIES)
+    gen.add_argument("--n", default="100", help="comma separated sizes, e.g. 50,100,200")
+    gen.add_argument("--p", default="0.5", help="comma separated densities")
+    gen.add_argument("--seeds", type=int, default=1, help="instances per (n, p)")
+    gen.add_argument("--k", type=int, help="clique size (brock/planted, default sqrt(n))")
+    gen.add_argument("--spread", type=float, help="p_hat degree spread (default 0.5)")
+    gen.add_argument("--gamma", type=float, help="power-law exponent (default 2.5)")
+    gen.add_argument("--avg-degree", type=float, help="power-law average degree (default 10)")
+
+    plot = sub.add_parser("plot", help="scaling curves of a sweep from results.csv")
+    plot.add_argument("name")
+    plot.add_argument("--x", choices=["n", "density"], default="n")
+
+    args = parser.parse_args()
+    if args.command == "sweep":
+        params = {key: value for key, value in [("k", args.k), ("spread", args.spread),
+                                                ("gamma", args.gamma), ("avg_degree", args.avg_degree)]
+                  if value is not None}
+        folder = sweep(args.name, args.family,
+                       [int(v) for v in args.n.split(",")],
+                       [float(v) for v in args.p.split(",")],
+                       range(args.seeds), **params)
+        print(f"\nDone. Run it with: python timeTest.py {os.path.relpath(folder, DIMACS_FOLDER)}")
+    else:
+        scaling_plots(args.name, args.x)
+
+if __name__ == "__main__":
+    main()
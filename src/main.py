@@ -1,53 +1,254 @@
+"""
+Command line entry point.
+  python main.py solve [graphs...] [--solver NAME] [--jobs N]   max clique of files, folders or globs
+  python main.py bench [timeTest.py options]                    time/memory benchmark of all versions
+  python main.py plot [--csv FILE] [--sweep NAME]               plots from results.csv
+  python main.py cache build|list|clear [graphs...]             pre-parsed copies of DIMACS files
+Solver modules and plotting libraries are only imported by the command that needs them,
+so solving a small graph starts straight away.
+"""
+# `python main.py <graph> [--solver NAME]` (no command) still works and means solve.
+
+import argparse
+import functools
+import glob
+import hashlib
+import importlib
 import os
+import pickle
 import sys
 import time
+from array import array
 from parser import parse_dimacs_graph
-from search import search_max_clique
 
-DIMACS_FOLDER = "DIMACS"
-def run_single_graph(file_name):
-    """Run the search algorithm on one graph file"""
-    print(f"\nRunning {file_name}...")
-    path = os.path.join(DIMACS_FOLDER, file_name)
+SRC_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DIMACS_FOLDER = os.path.normpath(os.path.join(SRC_FOLDER, "..", "DIMACS"))
+CACHE_FOLDER = os.path.join(DIMACS_FOLDER, ".cache")
+DEFAULT_SOLVER = "auto"
+COMMANDS = ["solve", "bench", "plot", "cache"]
+
+# Solver registry: name --> (module, options). The module is imported when the solver
+# runs, and every module has the same search_max_clique(graph, **options) entry point.
+SOLVERS = {
+    "search": ("search", {}),
+    "search2": ("search2", {}),
+    "search3": ("search3", {}),
+    "search4": ("search4", {}),
+    "search4+symmetry": ("search4", {"symmetry": True}),
+    "search5": ("search5", {}),
+    "search6": ("search6", {}),
+    "search7": ("search7", {}),
+    "portfolio": ("portfolio", {}),
+    "auto": ("selector", {}),
+}
+
+def get_solver(name):
+    """Registry name --> search_max_clique function with its options bound."""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown solver '{name}' (expected one of {', '.join(SOLVERS)})")
+    module_name, options = SOLVERS[name]
+    func = getattr(importlib.import_module(module_name), "search_max_clique")
+    return functools.partial(func, **options)
+
+# ---------- Graph files and the parse cache ----------
 
-    # Read graph
+def graph_files(patterns):
+    """
+    Files, folders (every .clq inside) and glob patterns --> sorted list of paths.
+    Anything not found as given is also looked up inside DIMACS/. No patterns: all of DIMACS/.
+    """
+    if not patterns:
+        patterns = [DIMACS_FOLDER]
+    files = []
+    for pattern in patterns:
+        for base in ("", DIMACS_FOLDER):
+            path = os.path.join(base, pattern)
+            if os.path.isdir(path):
+                found = sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith(".clq"))
+            else:
+                found = sorted(glob.glob(path))
+            if found:
+                files.extend(found)
+                break
+        else:
+            raise FileNotFoundError(f"No graph files match '{pattern}' (also looked in {DIMACS_FOLDER})")
+    return files
+
+def _cache_path(path):
+    """Cache file for this graph file; the key changes when the file does."""
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return os.path.join(CACHE_FOLDER, f"{os.path.basename(path)}.{digest}.pickle")
+
+def _parse(path):
+    """(num_vertices, flat edge array u1 v1 u2 v2 ...) straight from the DIMACS file."""
     num_vertices, edges = parse_dimacs_graph(path)
-    print(f"==> Vertices: {num_vertices}, Edges: {len(edges)}")
+    return num_vertices, array("i", [x for edge in edges for x in edge])
 
-    # Build adjacency list
+def read_edges(path):
+    """Like _parse(), but from the cache when the file has been cached."""
+    cached = _cache_path(path)
+    if os.path.exists(cached):
+        with open(cached, "rb") as f:
+            return pickle.load(f)
+    return _parse(path)
+
+def load_graph(path):
+    """Reads the DIMACS file (or its cached copy) and builds the graph"""
+    num_vertices, flat = read_edges(path)
     graph = {i: set() for i in range(1, num_vertices + 1)}
-    for u, v in edges:
+    pairs = iter(flat)
+    for u, v in zip(pairs, pairs):
         graph[u].add(v)
         graph[v].add(u)
+    return graph
+
+# ---------- solve ----------
+
+def solve_file(path, solver=DEFAULT_SOLVER):
+    """Max clique of one graph file. Returns a dict for print_solution()."""
+    graph = load_graph(path)
+    report = {"file": os.path.relpath(path), "vertices": len(graph),
+              "edges": sum(len(graph[v]) for v in graph) // 2, "solver": solver}
+
+    # Pick the solver (auto --> from instance features)
+    if solver == "auto":
+        from selector import choose_solver
+
+        name, module_name, options, feats, elapsed = choose_solver(graph)
+        report["selected"] = (f"{name} (density {feats['density']:.3f}, "
+                              f"degeneracy {feats['degeneracy']}, features {elapsed * 1000:.1f} ms)")
+        func = getattr(importlib.import_module(module_name), "search_max_clique")
+        search_max_clique = lambda g: func(g, **options)
+    else:
+        search_max_clique = get_solver(solver)
 
     # Run the search
     start = time.time()
     result = search_max_clique(graph)
-    end = time.time()
+    report["time"] = time.time() - start
+    report["clique"] = sorted(result)
+    return report
+
+def print_solution(report):
+    print(f"\nRunning {report['file']}...")
+    print(f"==> Vertices: {report['vertices']}, Edges: {report['edges']}")
+    if "selected" in report:
+        print(f"==> Auto selected {report['selected']}")
+    print(f"==> Max clique size: {len(report['clique'])}")
+    print(f"==> Max clique: {report['clique']}")
+    print(f"==> Time: {report['time']:.3f} s")
+
+def solve(files, solver=DEFAULT_SOLVER, jobs=1):
+    """Solve every file, 'jobs' graphs at a time (separate processes when jobs > 1)."""
+    if jobs <= 1 or len(files) <= 1:
+        reports = []
+        for path in files:
+            reports.append(solve_file(path, solver))
+            print_solution(reports[-1])
+        return reports
+
+    # Not multiprocessing.Pool: its workers are daemons and can't start the portfolio's engines
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        reports = list(pool.map(solve_file, files, [solver] * len(files)))
+    for report in reports:
+        print_solution(report)
+    return reports
 
-    print(f"==> Max clique size: {len(result)}")
-    print(f"==> Max clique: {sorted(result)}")
-    print(f"==> Time: {end - start:.3f} s")
+# ---------- bench / plot / cache ----------
 
-def main():
-    # If a specific graph is passed
-    if len(sys.argv) > 1:
-        file_name = sys.argv[1]
-        run_single_graph(file_name)
+def bench(args):
+    """timeTest.py with these arguments (results.csv and plots/ go to src/)."""
+    os.chdir(SRC_FOLDER)
+    import timeTest
+
+    timeTest.main(args)
+
+def plot(csv_path, sweep=None, x="n"):
+    """Plots from results.csv: timeTest's bar charts and resultsGraphs' summaries, or a sweep's scaling curves."""
+    os.chdir(SRC_FOLDER)
+    if sweep is not None:
+        from generator import scaling_plots
+
+        scaling_plots(sweep, x, csv_path)
+        return
+    import timeTest
+    import resultsGraphs
+
+    timeTest.generate_plots_from_csv(csv_path)
+    resultsGraphs.main(csv_path, show=False)
+
+def cache(action, patterns):
+    """build: parse the graph files into CACHE_FOLDER; list: show it; clear: delete it."""
+    if action == "build":
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        for path in graph_files(patterns):
+            cached = _cache_path(path)
+            if os.path.exists(cached):
+                continue
+            with open(cached, "wb") as f:
+                pickle.dump(_parse(path), f)
+            print(f"[cache] {os.path.relpath(path)}")
+        return
+
+    entries = sorted(os.listdir(CACHE_FOLDER)) if os.path.isdir(CACHE_FOLDER) else []
+    if action == "list":
+        for name in entries:
+            print(f"{name}  {os.path.getsize(os.path.join(CACHE_FOLDER, name)) / 1024:.0f} KiB")
+        print(f"[cache] {len(entries)} file(s) in {os.path.relpath(CACHE_FOLDER)}")
     else:
-        # If no argument, run all .clq files in DIMACS folder
-        print("No file provided. Running all .clq files in DIMACS folder...\n")
-        files = [f for f in os.listdir("DIMACS") if f.endswith(".clq")]
-        files.sort()
+        for name in entries:
+            os.remove(os.path.join(CACHE_FOLDER, name))
+        print(f"[cache] Removed {len(entries)} file(s)")
 
-        if not files:
-            print("No .clq files found in DIMACS folder.")
-            sys.exit(1)
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS + ["-h", "--help"]:
+        argv = ["solve"] + argv  # old style: python main.py [graph_file] [--solver NAME]
+    if argv[0] == "bench" and argv[1:2] not in (["-h"], ["--help"]):
+        # Everything after bench belongs to timeTest (argparse would take --estimate etc.)
+        bench(argv[1:])
+        return
 
-        for f in files:
-            run_single_graph(f)
+    parser = argparse.ArgumentParser(description="Maximum clique solvers, benchmarks and plots.")
+    sub = parser.add_subparsers(dest="command", required=True)
 
-    print("\nAll graphs done.")
+    p_solve = sub.add_parser("solve", help="find the maximum clique of graph files")
+    p_solve.add_argument("graphs", nargs="*", help="files, folders or glob patterns (default: all of DIMACS/)")
+    p_solve.add_argument("--solver", default=DEFAULT_SOLVER, choices=list(SOLVERS))
+    p_solve.add_argument("--jobs", "-j", type=int, default=1, help="graphs solved in parallel")
+
+    p_bench = sub.add_parser("bench", help="run timeTest.py (e.g. bench brock200_2.clq --estimate)")
+    p_bench.add_argument("args", nargs=argparse.REMAINDER)
+
+    p_plot = sub.add_parser("plot", help="plots from results.csv")
+    p_plot.add_argument("--csv", default="results.csv")
+    p_plot.add_argument("--sweep", help="scaling curves of a generator.py sweep instead")
+    p_plot.add_argument("--x", choices=["n", "density"], default="n")
+
+    p_cache = sub.add_parser("cache", help="pre-parsed graph files for faster loading")
+    p_cache.add_argument("action", choices=["build", "list", "clear"])
+    p_cache.add_argument("graphs", nargs="*", help="for build (default: all of DIMACS/)")
+
+    args = parser.parse_args(argv)
+    if args.command == "solve":
+        try:
+            files = graph_files(args.graphs)
+        except FileNotFoundError as e:
+            print(e)
+            sys.exit(1)
+        if not files:
+            print("No .clq files found.")
+            sys.exit(1)
+        solve(files, args.solver, args.jobs)
+        print("\nAll graphs done.")
+    elif args.command == "plot":
+        plot(args.csv, args.sweep, args.x)
+    else:
+        cache(args.action, args.graphs)
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import os
+from array import array
 
 def parse_dimacs_graph(filename):
     """
@@ -36,6 +37,65 @@ def parse_dimacs_graph(filename):
     return num_vertices, edges
 
 
+def parse_dimacs_csr(filename):
+    """
+    Parse a DIMACS format graph file straight into CSR (compressed sparse row) arrays.
+    No edge set or adjacency sets are built, so memory stays linear in the number of edges.
+
+    Returns:
+        tuple: (num_vertices, offsets, targets) with 0-based vertex ids. The neighbours
+        of v are targets[offsets[v]:offsets[v + 1]], sorted and without duplicates.
+    """
+    num_vertices = 0
+    heads, tails = array('i'), array('i')
+
+    with open(filename, 'r') as f:
+        for line in f:
+            if line.startswith('p'):
+                num_vertices = int(line.split()[2])
+            elif line.startswith('e'):
+                parts = line.split()
+                u = int(parts[1]) - 1
+                v = int(parts[2]) - 1
+                if u != v:
+                    heads.append(u)
+                    tails.append(v)
+
+    # Count both directions, then prefix sums give the row starts
+    degree = array('i', bytes(4 * num_vertices))
+    for u in heads:
+        degree[u] += 1
+    for v in tails:
+        degree[v] += 1
+    offsets = array('l', bytes(array('l').itemsize * (num_vertices + 1)))
+    for v in range(num_vertices):
+        offsets[v + 1] = offsets[v] + degree[v]
+
+    targets = array('i', bytes(4 * offsets[num_vertices]))
+    fill = array('l', offsets[:num_vertices])
+    for u, v in zip(heads, tails):
+        targets[fill[u]] = v
+        fill[u] += 1
+        targets[fill[v]] = u
+        fill[v] += 1
+    del heads, tails, fill
+
+    # Sort each row and squeeze out duplicate edges (e.g. "e 1 2" and "e 2 1")
+    write = 0
+    start = 0
+    for v in range(num_vertices):
+        end = offsets[v + 1]
+        row = sorted(set(targets[start:end]))
+        offsets[v] = write
+        targets[write:write + len(row)] = array('i', row)
+        write += len(row)
+        start = end
+    offsets[num_vertices] = write
+    del targets[write:]
+
+    return num_vertices, offsets, targets
+
+
 # Example usage:
 # num_vertices, edges = parse_dimacs_graph('C125.9.clq')
 # print(f"Graph has {num_vertices} vertices and {len(edges)} edges")
@@ -0,0 +1,228 @@
+"""
+Parallel portfolio: race several search engines on the same graph.
+Each engine runs in its own process (like timeTest.run_version). They share the best
+clique found so far, and the first engine to finish has proved optimality, so the others
+are stopped straight away.
+"""
+
+import importlib
+import csv
+import os
+import sys
+import time
+import multiprocessing
+from parser import parse_dimacs_graph
+
+# (name, module, options) --> different algorithms, orderings and bounds
+ENGINES = [
+    ("search4", "search4", {}),
+    ("search4+symmetry", "search4", {"symmetry": True}),
+    ("search5", "search5", {}),
+    ("search6", "search6", {}),
+    ("search7", "search7", {}),
+]
+DIMACS_FOLDER = "../DIMACS"
+OUTPUT_FILE = "portfolio.csv"
+STOP_GRACE = 1.0  # seconds the other engines get to stop by themselves before terminate()
+
+def load_graph(file_name):
+    """Reads the DIMACS file and builds the graph"""
+    path = os.path.join(DIMACS_FOLDER, file_name)
+    num_vertices, edges = parse_dimacs_graph(path)
+    graph = {i: set() for i in range(1, num_vertices + 1)}
+    for u, v in edges:
+        graph[u].add(v)
+        graph[v].add(u)
+    return graph
+
+
+class SearchStopped(Exception):
+    """Raised by SharedIncumbent.poll() once another engine has finished."""
+
+
+class SharedIncumbent:
+    """
+    Best clique shared between engine processes, plus per-engine progress counters.
+    Engines call poll() once per search node and offer() when they find a bigger clique.
+    """
+
+    def __init__(self, num_vertices, num_engines):
+        self._lock = multiprocessing.Lock()
+        self._stop = multiprocessing.Value("b", 0, lock=False)
+        self._size = multiprocessing.Value("i", 0, lock=False)
+        self._clique = multiprocessing.Array("i", max(num_vertices, 1), lock=False)
+        self._nodes = multiprocessing.Array("q", num_engines, lock=False)
+        self._own_best = multiprocessing.Array("i", num_engines, lock=False)
+        self.engine = 0  # set in each worker process
+
+    @property
+    def size(self):
+        return self._size.value
+
+    def poll(self):
+        """Count one search node for this engine and return the shared best size."""
+        if self._stop.value:
+            raise SearchStopped()
+        self._nodes[self.engine] += 1
+        return self._size.value
+
+    def stop(self):
+        """Ask every engine to stop at its next poll()."""
+        self._stop.value = 1
+
+    def offer(self, clique):
+        """Publish a clique found by this engine (kept only if it is the biggest)."""
+        if len(clique) > self._own_best[self.engine]:
+            self._own_best[self.engine] = len(clique)
+        with self._lock:
+            if len(clique) > self._size.value:
+                self._clique[:len(clique)] = list(clique)
+                self._size.value = len(clique)
+
+    def best(self):
+        """Copy of the best clique found by any engine."""
+        with self._lock:
+            return list(self._clique[:self._size.value])
+
+    def final_best(self):
+        """
+        Like best(), but only once every engine process has been joined. It skips the
+        lock, which an engine terminated inside offer()/best() never releases.
+        """
+        return list(self._clique[:self._size.value])
+
+    def progress(self, engine):
+        """(search nodes, best clique size found by the engine itself)."""
+        return self._nodes[engine], self._own_best[engine]
+
+
+def _engine_worker(engine, module_name, options, graph, shared, queue):
+    """Internal worker that runs one engine and reports back on the queue."""
+    shared.engine = engine
+    try:
+        func = getattr(importlib.import_module(module_name), "search_max_clique")
+        result = func(graph, shared=shared, **options)
+        shared.offer(result)
+        queue.put((engine, None))
+    except SearchStopped:
+        pass  # another engine finished first
+    except Exception as e:
+        queue.put((engine, str(e)))
+
+def run_portfolio(graph, engines=ENGINES, timeout=600):
+    """
+    Runs all engines in parallel until one of them finishes (or 'timeout' seconds pass).
+    Returns a report dict: winner, time, clique and per-engine progress.
+    """
+    shared = SharedIncumbent(len(graph), len(engines))
+    queue = multiprocessing.Queue()
+    procs = []
+    for k, (_, module_name, options) in enumerate(engines):
+        p = multiprocessing.Process(target=_engine_worker,
+                                    args=(k, module_name, options, graph, shared, queue))
+        procs.append(p)
+
+    start = time.time()
+    for p in procs:
+        p.start()
+
+    winner = None
+    errors = {}
+    try:
+        while winner is None and len(errors) < len(engines):
+            remaining = timeout - (time.time() - start)
+            if remaining <= 0:
+                break
+            try:
+                engine, error = queue.get(timeout=remaining)
+            except Exception:
+                break  # timeout
+            if error is None:
+                winner = engine
+                elapsed = time.time() - start
+            else:
+                errors[engine] = error
+    finally:
+        # One engine finished --> the shared clique is optimal, stop the rest. They stop
+        # at their next poll(); only the ones that don't answer in time are terminated.
+        shared.stop()
+        deadline = time.time() + STOP_GRACE
+        for p in procs:
+            p.join(max(deadline - time.time(), 0))
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+        for p in procs:
+            p.join()
+    if winner is None:
+        elapsed = time.time() - start
+
+    engines_report = []
+    for k, (name, _, _) in enumerate(engines):
+        nodes, own_best = shared.progress(k)
+        if k == winner:
+            status = "winner"
+        elif k in errors:
+            status = "error"
+        else:
+            status = "stopped"
+        engines_report.append({"engine": name, "status": status,
+                               "nodes": nodes, "best": own_best})
+
+    return {
+        "winner": engines[winner][0] if winner is not None else "timeout",
+        "time": elapsed,
+        "clique": shared.final_best(),
+        "optimal": winner is not None,
+        "engines": engines_report,
+    }
+
+def search_max_clique(graph, timeout=600):
+    """The portfolio as a single solver: best clique found (optimal unless it timed out)."""
+    return sorted(run_portfolio(graph, timeout=timeout)["clique"])
+
+
+def solve_one_graph(graph_file, engines=ENGINES):
+    """Runs the portfolio on one graph, prints the report and appends it to the CSV."""
+    print(f"\nPortfolio on {graph_file}...")
+    graph = load_graph(graph_file)
+    report = run_portfolio(graph, engines)
+
+    print(f"==> Winner: {report['winner']} in {report['time']:.3f} s")
+    print(f"==> Max clique size: {len(report['clique'])}"
+          + ("" if report["optimal"] else " (not proved optimal)"))
+    for e in report["engines"]:
+        print(f"     {e['engine']:<18} {e['status']:<8} nodes = {e['nodes']}, own best = {e['best']}")
+
+    # One row per run: which engine won and how far each one got
+    fieldnames = ["File", "Winner", "Time", "Size"] + [f"{name} nodes" for name, _, _ in engines]
+    row = {"File": graph_file, "Winner": report["winner"],
+           "Time": round(report["time"], 3), "Size": len(report["clique"])}
+    for e in report["engines"]:
+        row[f"{e['engine']} nodes"] = e["nodes"]
+
+    write_header = not os.path.exists(OUTPUT_FILE)
+    with open(OUTPUT_FILE, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(row)
+    return report
+
+def main():
+    # If a specific graph is given, run just that one
+    if len(sys.argv) > 1:
+        solve_one_graph(sys.argv[1])
+    else:
+        print("No file given, running the portfolio on all .clq graphs in DIMACS...\n")
+        graphs = sorted(f for f in os.listdir(DIMACS_FOLDER) if f.endswith(".clq"))
+        if not graphs:
+            print("No .clq files found in DIMACS folder.")
+            sys.exit(1)
+        for g in graphs:
+            solve_one_graph(g)
+
+    print("\nPortfolio finished.")
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ https://link.springer.com/content/pdf/10.1007/978-3-642-11440-3_18.pdf?pdf=inlin
 
 import sys
 from parser import parse_dimacs_graph
+from symmetry import automorphism_orbits
+
+SYMMETRY_MIN_NODES = 1000  # with symmetry=True: subtree size before orbits are computed
+DISCRETE_RATIO = 0.9       # root orbits / vertices above this --> no stabilizer orbits
 
 def is_clique(graph, nodes):
     """Check if the given nodes form a clique."""
@@ -19,9 +23,37 @@ def is_clique(graph, nodes):
                 return False
     return True
 
-def search_max_clique(graph):
+def greedy_colouring_bound(graph, deg, cands):
+    """
+    Return order(candidates ordered by color) and bound(color indices).
+    """
+    uncolored = sorted(cands, key=lambda v: deg[v], reverse=True) # order by degree
+    order, bound = [], []
+    color = 0 
+
+    while uncolored:
+        color += 1 # new color
+        chosen, remaining = [], []
+        for vertex in uncolored:
+            if all(vertex not in graph[u] for u in chosen): # can use this color
+                chosen.append(vertex)   # assign color
+            else:
+                remaining.append(vertex) # try later
+        for vertex in chosen:
+            order.append(vertex)
+            bound.append(color)
+        uncolored = remaining
+
+    return order, bound
+
+def search_max_clique(graph, symmetry=False, shared=None):
     """
     BnB with Greedy Colouring Bound.
+    With symmetry=True, only one vertex per automorphism orbit is branched on at the
+    root (and per orbit of its stabilizer one level below). Same clique size, fewer nodes.
+    Orbits are computed only at nodes whose subtree has already taken SYMMETRY_MIN_NODES
+    nodes; siblings explored before that count as done for their orbits.
+    shared: optional SharedIncumbent (portfolio.py) to swap best cliques with other engines.
     """
     # Degree order helps the colorer a bit
     deg = {v: len(graph[v]) for v in graph}
@@ -30,33 +62,40 @@ def search_max_clique(graph):
     max_clique = []
     current = []
 
-    def greedy_colouring_bound(cands):
-        """
-        Return order(candidates ordered by color) and bound(color indices).
-        """
-        uncolored = sorted(cands, key=lambda v: deg[v], reverse=True) # order by degree
-        order, bound = [], []
-        color = 0 
-
-        while uncolored:
-            color += 1 # new color
-            chosen, remaining = [], []
-            for vertex in uncolored:
-                if all(vertex not in graph[u] for u in chosen): # can use this color
-                    chosen.append(vertex)   # assign color
-                else:
-                    remaining.append(vertex) # try later
-            for vertex in chosen:
-                order.append(vertex)
-                bound.append(color)
-            uncolored = remaining
-
-        return order, bound
+    # Symmetry detection costs more than the whole search on easy graphs, so each node
+    # only asks for orbits once its subtree has used SYMMETRY_MIN_NODES search nodes.
+    nodes = 0
+    orbit_cache = {}
+
+    def orbits_here():
+        """Orbits valid at this node (automorphisms fixing the current clique), or None."""
+        if len(current) > 1:
+            return None
+        if "root" not in orbit_cache:
+            root = automorphism_orbits(graph)
+            orbit_cache["root"] = root
+            # Stabilizers are only worth computing when the root has real symmetry
+            orbit_cache["symmetric"] = len(set(root.values())) <= DISCRETE_RATIO * len(root)
+        if not current:
+            return orbit_cache["root"]
+        if not orbit_cache["symmetric"]:
+            return None
+        if current[0] not in orbit_cache:
+            orbit_cache[current[0]] = automorphism_orbits(graph, fixed=current)
+        return orbit_cache[current[0]]
 
     def expand(cands):
-        nonlocal max_clique
+        nonlocal max_clique, nodes
+        nodes += 1
+        start_nodes = nodes
 
-        order, bound = greedy_colouring_bound(cands)
+        if shared is not None and shared.poll() > len(max_clique):
+            max_clique = shared.best() # another engine found a bigger clique
+
+        order, bound = greedy_colouring_bound(graph, deg, cands)
+        orbit, checked = None, False
+        explored = [] # vertices already branched on at this node
+        done = set() # orbits already explored at this node
 
         # Go from most promising to least --> prune by color bound
         for i in range(len(order) - 1, -1, -1):
@@ -64,6 +103,20 @@ def search_max_clique(graph):
                 return
 
             vertex = order[i]
+            if (symmetry and not checked and len(current) <= 1
+                    and nodes - start_nodes >= SYMMETRY_MIN_NODES):
+                checked = True
+                orbit = orbits_here()
+                if orbit is not None:
+                    done = {orbit[v] for v in explored}
+            if orbit is not None:
+                # An automorphism fixing current maps vertex onto an explored one
+                if orbit[vertex] in done:
+                    cands.discard(vertex)
+                    continue
+                done.add(orbit[vertex])
+            explored.append(vertex)
+
             current.append(vertex)
             new_cands = cands & graph[vertex]
 
@@ -71,6 +124,8 @@ def search_max_clique(graph):
             if not new_cands:
                 if len(current) > len(max_clique):
                     max_clique = current[:]
+                    if shared is not None:
+                        shared.offer(max_clique)
             else:
                 expand(new_cands)
 
@@ -82,10 +137,11 @@ def search_max_clique(graph):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python search.py <graph_file>")
+        print("Usage: python search4.py <graph_file> [--symmetry]")
         sys.exit(1)
 
     filename = sys.argv[1]
+    symmetry = "--symmetry" in sys.argv[2:]
     n, edges = parse_dimacs_graph(filename)
 
     # Adjacency as sets (fast intersections)
@@ -94,6 +150,6 @@ if __name__ == "__main__":
         graph[a].add(b)
         graph[b].add(a)
 
-    clique = search_max_clique(graph)
+    clique = search_max_clique(graph, symmetry=symmetry)
     print(f"Maximum clique size: {len(clique)}")
     print(f"Maximum clique: {sorted(clique)}")
\ No newline at end of file
@@ -0,0 +1,324 @@
+"""
+Search 5 algorithm for dense graphs: Minimum Vertex Cover on the complement graph.
+Branch-and-Reduce for Vertex Cover / Maximum Independent Set (Akiba & Iwata approach).
+Branch-and-reduce exponential/FPT algorithms in practice: A case study of vertex cover — Takuya Akiba and Yoichi Iwata, 2016.
+https://doi.org/10.1016/j.tcs.2015.09.023
+"""
+# A clique in G is an independent set in the complement of G, and an independent set
+# is whatever is left after removing a vertex cover. On very dense graphs
+# (MANN_a9, hamming*) the complement is sparse, so the kernelization rules below
+# shrink it a lot before we need to branch at all.
+# For graphs under DENSITY_THRESHOLD we just call search4 (colour bound works better there).
+
+import sys
+from itertools import count
+from parser import parse_dimacs_graph
+from search4 import search_max_clique as colouring_search
+
+DENSITY_THRESHOLD = 0.8  # use the complement route from this edge density upwards
+
+def is_clique(graph, nodes):
+    """Check if the given nodes form a clique."""
+    for i in range(len(nodes)):
+        for j in range(i + 1, len(nodes)):
+            if nodes[j] not in graph[nodes[i]]:
+                return False
+    return True
+
+def density(graph):
+    """Edge density of the graph (1.0 means complete)."""
+    n = len(graph)
+    if n < 2:
+        return 1.0
+    edges = sum(len(graph[v]) for v in graph) / 2
+    return 2 * edges / (n * (n - 1))
+
+def complement(graph):
+    """Complement graph as adjacency sets (same vertex labels)."""
+    vertices = set(graph.keys())
+    return {v: vertices - graph[v] - {v} for v in graph}
+
+def _remove(g, v):
+    """Delete v from g (in place)."""
+    for u in g.pop(v):
+        g[u].discard(v)
+
+def _lp_reduction(g):
+    """
+    Nemhauser-Trotter (crown / LP) reduction.
+    A maximum matching in the bipartite double cover gives a half-integral optimal LP
+    vertex cover. Vertices with x=0 can go in the independent set, x=1 in the cover.
+    Returns (in_set, in_cover).
+    """
+    # Hopcroft-Karp style augmenting paths (left copy -> right copy)
+    match_left, match_right = {}, {}
+
+    def augment(root):
+        # iterative DFS for an augmenting path from a free left vertex
+        parent = {}
+        stack = [root]
+        seen = {root}
+        while stack:
+            left = stack.pop()
+            for right in g[left]:
+                if right in parent:
+                    continue
+                parent[right] = left
+                nxt = match_right.get(right)
+                if nxt is None:
+                    # flip the path
+                    while right is not None:
+                        left = parent[right]
+                        prev = match_left.get(left)
+                        match_left[left] = right
+                        match_right[right] = left
+                        right = prev
+                    return True
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return False
+
+    # greedy start makes the augmenting phase short
+    for v in g:
+        if v in match_left:
+            continue
+        for u in g[v]:
+            if u not in match_right:
+                match_left[v] = u
+                match_right[u] = v
+                break
+    for v in g:
+        if v not in match_left:
+            augment(v)
+
+    # Konig: Z = vertices reachable from free left vertices by alternating paths
+    z_left = {v for v in g if v not in match_left}
+    z_right = set()
+    frontier = list(z_left)
+    while frontier:
+        left = frontier.pop()
+        for right in g[left]:
+            if right not in z_right:
+                z_right.add(right)
+                nxt = match_right.get(right)
+                if nxt is not None and nxt not in z_left:
+                    z_left.add(nxt)
+                    frontier.append(nxt)
+    # cover = (L \ Z) + (R & Z); x_v = (copies of v in cover) / 2
+    in_set, in_cover = [], []
+    for v in g:
+        copies = (v not in z_left) + (v in z_right)
+        if copies == 0:
+            in_set.append(v)
+        elif copies == 2:
+            in_cover.append(v)
+    return in_set, in_cover
+
+def _reduce(g, new_label):
+    """
+    Apply the kernelization rules until none fires (g is modified in place).
+    Returns (taken, folds): vertices forced into the independent set and the
+    degree-2 folds to undo afterwards, as (folded, v, u, w) tuples.
+    """
+    taken, folds = [], []
+    changed = True
+    while changed:
+        changed = False
+
+        # --- Degree 0 / 1 / 2 ---
+        queue = [v for v in g if len(g[v]) <= 2]
+        while queue:
+            v = queue.pop()
+            if v not in g:
+                continue
+            deg = len(g[v])
+            if deg > 2:
+                continue
+            touched = set()
+            if deg == 0:
+                taken.append(v)
+                g.pop(v)
+            elif deg == 1:
+                # v is always at least as good as its only neighbour
+                (u,) = g[v]
+                taken.append(v)
+                touched |= g[u]
+                _remove(g, v)
+                _remove(g, u)
+            else:
+                u, w = g[v]
+                touched |= g[u] | g[w]
+                if w in g[u]:
+                    # triangle: take v, drop u and w
+                    taken.append(v)
+                    for x in (v, u, w):
+                        _remove(g, x)
+                else:
+                    # fold v, u, w into a single vertex adjacent to N(u) + N(w)
+                    folded = next(new_label)
+                    nbrs = (g[u] | g[w]) - {v}
+                    for x in (v, u, w):
+                        _remove(g, x)
+                    g[folded] = nbrs
+                    for x in nbrs:
+                        g[x].add(folded)
+                    folds.append((folded, v, u, w))
+                    touched.add(folded)
+            changed = True
+            queue.extend(x for x in touched if x in g and len(g[x]) <= 2)
+
+        # --- Domination: N[u] inside N[v] means some MIS avoids v ---
+        for v in list(g):
+            closed_v = g[v] | {v}
+            # checked against the current graph so twins don't remove each other
+            if any(len(g[u]) <= len(g[v]) and g[u] <= closed_v for u in g[v]):
+                _remove(g, v)
+                changed = True
+        if changed:
+            continue
+
+        # --- LP / crown reduction (only when the cheap rules are stuck) ---
+        if g:
+            in_set, in_cover = _lp_reduction(g)
+            for v in in_cover:
+                _remove(g, v)
+            for v in in_set:
+                taken.append(v)
+                g.pop(v)
+            changed = bool(in_set or in_cover)
+
+    return taken, folds
+
+def _unfold(solution, folds):
+    """Turn a solution of the reduced graph back into one of the original graph."""
+    for folded, v, u, w in reversed(folds):
+        if folded in solution:
+            solution.discard(folded)
+            solution.add(u)
+            solution.add(w)
+        else:
+            solution.add(v)
+    return solution
+
+def _clique_cover_bound(g):
+    """Greedy clique cover: an independent set picks at most one vertex per clique."""
+    cliques = []
+    for v in sorted(g, key=lambda x: len(g[x]), reverse=True):
+        for clique in cliques:
+            if clique <= g[v]:
+                clique.add(v)
+                break
+        else:
+            cliques.append({v})
+    return len(cliques)
+
+def _components(g):
+    """Split g into connected components (lists of vertices)."""
+    seen, comps = set(), []
+    for start in g:
+        if start in seen:
+            continue
+        seen.add(start)
+        comp, stack = [], [start]
+        while stack:
+            v = stack.pop()
+            comp.append(v)
+            for u in g[v]:
+                if u not in seen:
+                    seen.add(u)
+                    stack.append(u)
+        comps.append(comp)
+    return comps
+
+def max_independent_set(graph):
+    """Branch-and-reduce Maximum Independent Set (= complement of a Minimum Vertex Cover)."""
+    new_label = count(-1, -1)  # fold vertices get negative labels (DIMACS ids are positive)
+
+    def solve(g, lower):
+        """Return a maximum independent set of g if it has more than 'lower' vertices, else None."""
+        g = {v: set(g[v]) for v in g}
+        taken, folds = _reduce(g, new_label)
+        need = lower - len(taken) - len(folds)  # what the kernel still has to beat
+
+        if not g:
+            best = set()
+        elif _clique_cover_bound(g) <= need:
+            return None
+        else:
+            comps = _components(g)
+            if len(comps) > 1:
+                best = solve_components(g, comps, need)
+            else:
+                best = branch(g, need)
+            if best is None:
+                return None
+
+        if len(best) <= need:
+            return None
+        return _unfold(best | set(taken), folds)
+
+    def solve_components(g, comps, need):
+        """Solve each component on its own, keeping the bound on the total."""
+        subgraphs = [{v: g[v] for v in comp} for comp in comps]
+        ubs = [_clique_cover_bound(sub) for sub in subgraphs]
+        best, found = set(), 0
+        for i, sub in enumerate(subgraphs):
+            rest = sum(ubs[i + 1:])
+            part = solve(sub, max(need - found - rest, -1))
+            if part is None:
+                return None
+            best |= part
+            found += len(part)
+        return best
+
+    def branch(g, need):
+        """Branch on a maximum-degree vertex: take it, or put it in the cover."""
+        v = max(g, key=lambda x: len(g[x]))
+        best = None
+
+        # v in the independent set --> drop its closed neighbourhood
+        g_in = {x: g[x] - g[v] for x in g if x != v and x not in g[v]}
+        part = solve(g_in, need - 1)
+        if part is not None:
+            part.add(v)
+            best, need = part, len(part)
+
+        # v in the vertex cover --> drop v only
+        g_out = {x: g[x] - {v} for x in g if x != v}
+        part = solve(g_out, need)
+        if part is not None:
+            best = part
+        return best
+
+    return solve(graph, -1) or set()
+
+def search_max_clique(graph, shared=None):
+    """
+    Maximum clique via Minimum Vertex Cover on the complement (dense graphs only).
+    shared (portfolio.py) is only used on the search4 route; the vertex cover search
+    keeps its own bounds.
+    """
+    if density(graph) < DENSITY_THRESHOLD:
+        return colouring_search(graph, shared=shared)
+
+    independent = max_independent_set(complement(graph))
+    return sorted(independent)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python search5.py <graph_file>")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    n, edges = parse_dimacs_graph(filename)
+
+    # Adjacency as sets (fast intersections)
+    graph = {i: set() for i in range(1, n + 1)}
+    for a, b in edges:
+        graph[a].add(b)
+        graph[b].add(a)
+
+    clique = search_max_clique(graph)
+    print(f"Maximum clique size: {len(clique)}")
+    print(f"Maximum clique: {sorted(clique)}")
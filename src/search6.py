@@ -0,0 +1,246 @@
+"""
+Search 6 algorithm for large sparse graphs (PMC approach).
+A Parallel Maximum Clique Algorithm for Large Sparse Graphs and Temporal Strong Components — Ryan A. Rossi et al., 2015.
+https://arxiv.org/abs/1302.6256
+"""
+# Works on CSR arrays (offsets/targets, 0-based ids) instead of the dict of sets, so
+# social/web graphs with 10^5-10^6 vertices fit in memory: everything global is an
+# array linear in the number of edges, and sets are only built for one neighbourhood
+# at a time. Parallelism from the paper is left out (single process).
+#   1. k-core decomposition in O(m) (Batagelj-Zaversnik bucket sort)
+#   2. greedy clique in core order --> lower bound
+#   3. for every vertex in degeneracy order: colouring BnB over its later neighbours,
+#      skipping vertices (and neighbours) whose core number can't beat the bound
+
+import sys
+from array import array
+from bisect import bisect_left
+from parser import parse_dimacs_csr
+
+def is_clique(graph, nodes):
+    """Check if the given nodes form a clique."""
+    for i in range(len(nodes)):
+        for j in range(i + 1, len(nodes)):
+            if nodes[j] not in graph[nodes[i]]:
+                return False
+    return True
+
+def csr_from_adjacency(graph):
+    """
+    Convert the usual dict of sets into CSR arrays.
+    Returns (labels, offsets, targets); internal id i stands for labels[i].
+    """
+    labels = sorted(graph.keys())
+    index = {v: i for i, v in enumerate(labels)}
+    offsets = array('l', [0])
+    targets = array('i')
+    for v in labels:
+        targets.extend(sorted(index[u] for u in graph[v]))
+        offsets.append(len(targets))
+    return labels, offsets, targets
+
+def core_decomposition(n, offsets, targets):
+    """
+    Linear time k-core decomposition.
+    Returns (core, order): core number per vertex and the degeneracy (peeling) order.
+    """
+    degree = array('i', (offsets[v + 1] - offsets[v] for v in range(n)))
+    max_deg = max(degree, default=0)
+
+    # Bucket sort vertices by degree
+    bin_start = array('l', bytes(array('l').itemsize * (max_deg + 1)))
+    for d in degree:
+        bin_start[d] += 1
+    start = 0
+    for d in range(max_deg + 1):
+        count = bin_start[d]
+        bin_start[d] = start
+        start += count
+    pos = array('l', bytes(array('l').itemsize * n))
+    order = array('i', bytes(4 * n))
+    for v in range(n):
+        pos[v] = bin_start[degree[v]]
+        order[pos[v]] = v
+        bin_start[degree[v]] += 1
+    for d in range(max_deg, 0, -1):
+        bin_start[d] = bin_start[d - 1]
+    if max_deg >= 0 and n:
+        bin_start[0] = 0
+
+    # Peel: the degree of a vertex when it is removed is its core number
+    for i in range(n):
+        v = order[i]
+        dv = degree[v]
+        for k in range(offsets[v], offsets[v + 1]):
+            u = targets[k]
+            du = degree[u]
+            if du > dv:
+                # move u to the front of its bucket, then shrink the bucket
+                pu = pos[u]
+                pw = bin_start[du]
+                w = order[pw]
+                if u != w:
+                    order[pu], order[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                bin_start[du] += 1
+                degree[u] = du - 1
+
+    return degree, order
+
+def _adjacent(offsets, targets, u, v):
+    """Binary search v in the (sorted) row of u."""
+    lo, hi = offsets[u], offsets[u + 1]
+    k = bisect_left(targets, v, lo, hi)
+    return k < hi and targets[k] == v
+
+def greedy_clique(n, offsets, targets, core, order, starts=None):
+    """
+    Heuristic lower bound: starting from high core vertices, greedily grow a clique
+    with the neighbours of highest core number.
+    starts: try only this many start vertices (the highest cores); None tries them all.
+    """
+    best = []
+    stop = -1 if starts is None else max(n - starts, 0) - 1
+    for i in range(n - 1, stop, -1):
+        v = order[i]
+        if core[v] < len(best):
+            break  # order is by core number: no clique through v (or later) is bigger
+        cands = [targets[k] for k in range(offsets[v], offsets[v + 1])
+                 if core[targets[k]] >= len(best)]
+        cands.sort(key=lambda u: core[u], reverse=True)
+        clique = [v]
+        for u in cands:
+            if all(_adjacent(offsets, targets, u, w) for w in clique):
+                clique.append(u)
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+def search_csr(n, offsets, targets, shared=None, labels=None):
+    """
+    Maximum clique on CSR arrays (0-based ids).
+    shared: optional SharedIncumbent (portfolio.py); cliques are exchanged using labels[id].
+    """
+    if n == 0:
+        return []
+    if labels is None:
+        labels = range(n)
+    index = {labels[v]: v for v in range(n)} if shared is not None else None
+    core, order = core_decomposition(n, offsets, targets)
+    rank = array('l', bytes(array('l').itemsize * n))
+    for i in range(n):
+        rank[order[i]] = i
+
+    max_clique = greedy_clique(n, offsets, targets, core, order)
+    current = []
+
+    def share():
+        """Publish our clique or adopt a bigger one from another engine."""
+        nonlocal max_clique
+        if shared.poll() > len(max_clique):
+            max_clique = [index[v] for v in shared.best()]
+        else:
+            shared.offer([labels[v] for v in max_clique])
+
+    if shared is not None:
+        share()
+
+    def greedy_colouring_bound(cands, local):
+        """Same colouring as search4, on the local neighbourhood graph."""
+        uncolored = sorted(cands, key=lambda v: len(local[v]), reverse=True)
+        order, bound = [], []
+        color = 0
+        while uncolored:
+            color += 1
+            chosen, remaining = [], []
+            for vertex in uncolored:
+                if all(vertex not in local[u] for u in chosen):
+                    chosen.append(vertex)
+                else:
+                    remaining.append(vertex)
+            for vertex in chosen:
+                order.append(vertex)
+                bound.append(color)
+            uncolored = remaining
+        return order, bound
+
+    def expand(cands, local):
+        nonlocal max_clique
+
+        if shared is not None and shared.poll() > len(max_clique):
+            max_clique = [index[v] for v in shared.best()]
+
+        order, bound = greedy_colouring_bound(cands, local)
+        for i in range(len(order) - 1, -1, -1):
+            if len(current) + bound[i] <= len(max_clique):
+                return
+
+            vertex = order[i]
+            current.append(vertex)
+            new_cands = cands & local[vertex]
+            if not new_cands:
+                if len(current) > len(max_clique):
+                    max_clique = current[:]
+                    if shared is not None:
+                        share()
+            else:
+                expand(new_cands, local)
+            current.pop()
+            cands.discard(vertex)
+
+    for i in range(n):
+        v = order[i]
+        best = len(max_clique)
+        if core[v] < best:
+            continue
+
+        # Later neighbours that could still be part of a bigger clique
+        cands = {targets[k] for k in range(offsets[v], offsets[v + 1])
+                 if rank[targets[k]] > i and core[targets[k]] >= best}
+        if len(cands) < best:
+            continue
+
+        # Neighbourhood subgraph (only this one is ever held as sets)
+        local = {u: cands.intersection(targets[offsets[u]:offsets[u + 1]]) for u in cands}
+
+        # Peel vertices that can't have best - 1 neighbours inside the clique
+        stack = [u for u in cands if len(local[u]) < best - 1]
+        while stack:
+            u = stack.pop()
+            if u not in cands:
+                continue
+            cands.discard(u)
+            for w in local.pop(u):
+                if w in cands:
+                    local[w].discard(u)
+                    if len(local[w]) == best - 2:
+                        stack.append(w)
+        if len(cands) < best:
+            continue
+
+        current.append(v)
+        expand(cands, local)
+        current.pop()
+
+    return max_clique
+
+def search_max_clique(graph, shared=None):
+    """
+    PMC-style search for large sparse graphs (dict of sets interface, converted to CSR).
+    """
+    labels, offsets, targets = csr_from_adjacency(graph)
+    clique = search_csr(len(labels), offsets, targets, shared, labels)
+    return [labels[v] for v in clique]
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python search6.py <graph_file>")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    # Straight into CSR: no edge set or adjacency sets for big inputs
+    n, offsets, targets = parse_dimacs_csr(filename)
+
+    clique = [v + 1 for v in search_csr(n, offsets, targets)]
+    print(f"Maximum clique size: {len(clique)}")
+    print(f"Maximum clique: {sorted(clique)}")
@@ -0,0 +1,107 @@
+"""
+Search 7 algorithm with Russian Doll Search (Patric Östergård approach, as in Cliquer).
+A fast algorithm for the maximum clique problem — Patric R. J. Östergård, 2002.
+https://doi.org/10.1016/S0166-218X(01)00290-6
+"""
+# Instead of one forward search, we solve growing suffixes of the vertex order:
+# S_i = {v_i, ..., v_n}, from i = n down to 1. c[i] is the max clique size inside S_i,
+# and it bounds any branch whose candidates all lie in S_i. Since c[i] <= c[i+1] + 1,
+# the search for S_i stops as soon as it finds a clique one bigger than before.
+
+import sys
+from parser import parse_dimacs_graph
+
+def is_clique(graph, nodes):
+    """Check if the given nodes form a clique."""
+    for i in range(len(nodes)):
+        for j in range(i + 1, len(nodes)):
+            if nodes[j] not in graph[nodes[i]]:
+                return False
+    return True
+
+def search_max_clique(graph, shared=None):
+    """
+    Russian Doll Search with the c[i] table as bound.
+    shared: optional SharedIncumbent (portfolio.py) to swap best cliques with other engines.
+    """
+    # Order by greedy colour classes (degree order inside, as search4's colouring),
+    # like Cliquer's default reordering. Much better than plain degree order here.
+    deg = {v: len(graph[v]) for v in graph}
+    uncolored = sorted(graph.keys(), key=lambda v: (deg[v], v), reverse=True)
+    vertices = []
+    while uncolored:
+        chosen, remaining = [], []
+        for vertex in uncolored:
+            if all(vertex not in graph[u] for u in chosen):
+                chosen.append(vertex)
+            else:
+                remaining.append(vertex)
+        vertices.extend(chosen)
+        uncolored = remaining
+    n = len(vertices)
+
+    # Work with positions in the order: candidate lists stay sorted for free
+    index = {v: i for i, v in enumerate(vertices)}
+    adj = [{index[u] for u in graph[v]} for v in vertices]
+
+    c = [0] * n
+    max_clique = []
+    current = []
+    found = False
+
+    def expand(cands):
+        """cands: positions sorted ascending (all inside the current suffix)."""
+        nonlocal max_clique, found
+
+        if shared is not None and shared.poll() > len(max_clique):
+            # A bigger clique from another engine only makes c[i] a looser (still valid) bound
+            max_clique = [index[v] for v in shared.best()]
+
+        if not cands:
+            if len(current) > len(max_clique):
+                max_clique = current[:]
+                found = True
+                if shared is not None:
+                    shared.offer([vertices[i] for i in max_clique])
+            return
+
+        for k in range(len(cands)):
+            # Size bound, then the Russian doll bound c[first candidate]
+            if len(current) + len(cands) - k <= len(max_clique):
+                return
+            i = cands[k]
+            if len(current) + c[i] <= len(max_clique):
+                return
+
+            current.append(i)
+            expand([j for j in cands[k + 1:] if j in adj[i]])
+            current.pop()
+            if found:
+                return
+
+    for i in range(n - 1, -1, -1):
+        found = False
+        current.append(i)
+        expand([j for j in range(i + 1, n) if j in adj[i]])
+        current.pop()
+        c[i] = len(max_clique)
+
+    return [vertices[i] for i in max_clique]
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python search7.py <graph_file>")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    n, edges = parse_dimacs_graph(filename)
+
+    # Build adjacency sets
+    graph = {i: set() for i in range(1, n + 1)}
+    for a, b in edges:
+        graph[a].add(b)
+        graph[b].add(a)
+
+    clique = search_max_clique(graph)
+    print(f"Maximum clique size: {len(clique)}")
+    print(f"Maximum clique: {sorted(clique)}")
@@ -0,0 +1,219 @@
+"""
+Automatic solver selection from cheap instance features.
+The model is a k-nearest-neighbour vote over the benchmark instances we already have
+timings for (results.csv from timeTest.py, portfolio.csv from portfolio.py): a new graph
+gets the solver that was fastest on the most similar known instances.
+"""
+# k-core peeling and the greedy colouring in degeneracy order are linear in the size of
+# the graph. The greedy clique is grown from GREEDY_STARTS vertices only, each costing
+# O(degree x clique size). That is a few ms on the benchmark graphs, up to ~60 ms on
+# dense ones (c-fat500-10, hamming8-2), so it matters only for solves that are that fast.
+
+import csv
+import importlib
+import json
+import math
+import os
+import sys
+import time
+from parser import parse_dimacs_graph
+from search6 import csr_from_adjacency, core_decomposition, greedy_clique
+from portfolio import ENGINES
+from search5 import DENSITY_THRESHOLD
+
+DIMACS_FOLDER = "../DIMACS"
+RESULTS_FILE = "results.csv"
+PORTFOLIO_FILE = "portfolio.csv"
+MODEL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "selector_model.json")
+DEFAULT_SOLVER = "search4"
+K_NEIGHBOURS = 3
+TIMEOUT = 600         # seconds charged for a timeout/error (timeTest's default limit)
+TIE_TOLERANCE = 0.1   # times within 10% (+ TIE_SECONDS) of the fastest count as a tie
+TIE_SECONDS = 0.05
+FEATURE_NAMES = ["log_n", "density", "degree_cv", "core_ratio", "bound_gap"]
+GREEDY_STARTS = 4     # greedy clique feature: grown from the 4 highest core vertices only
+
+def load_graph(file_name):
+    """Reads the DIMACS file and builds the graph"""
+    path = os.path.join(DIMACS_FOLDER, file_name)
+    num_vertices, edges = parse_dimacs_graph(path)
+    graph = {i: set() for i in range(1, num_vertices + 1)}
+    for u, v in edges:
+        graph[u].add(v)
+        graph[v].add(u)
+    return graph
+
+def features(graph):
+    """
+    Cheap instance features, as a dict:
+    n, density, degree variance, degeneracy (max core number), greedy clique size,
+    greedy colouring bound, and the normalised values the model uses (FEATURE_NAMES).
+    """
+    n = len(graph)
+    degrees = [len(graph[v]) for v in graph]
+    mean = sum(degrees) / n if n else 0.0
+    variance = sum((d - mean) ** 2 for d in degrees) / n if n else 0.0
+    density = mean / (n - 1) if n > 1 else 1.0
+
+    labels, offsets, targets = csr_from_adjacency(graph)
+    core, order = core_decomposition(n, offsets, targets)
+    degeneracy = max(core, default=0)
+    lower = len(greedy_clique(n, offsets, targets, core, order, GREEDY_STARTS))
+
+    # Greedy colouring in reverse degeneracy order (at most degeneracy + 1 colours)
+    colour = [0] * n
+    colours = 0
+    for i in range(n - 1, -1, -1):
+        v = order[i]
+        used = {colour[targets[k]] for k in range(offsets[v], offsets[v + 1])}
+        c = 1
+        while c in used:
+            c += 1
+        colour[v] = c
+        colours = max(colours, c)
+    upper = colours
+
+    return {
+        "n": n,
+        "density": density,
+        "degree_variance": variance,
+        "degeneracy": degeneracy,
+        "greedy_clique": lower,
+        "colour_bound": upper,
+        "log_n": math.log(n + 1),
+        "degree_cv": math.sqrt(variance) / mean if mean else 0.0,
+        "core_ratio": degeneracy / n if n else 0.0,
+        "bound_gap": (upper - lower) / upper if upper else 0.0,
+    }
+
+def configuration(name):
+    """Solver name (a module or a portfolio engine name) --> (module, options)."""
+    for engine, module_name, options in ENGINES:
+        if engine == name:
+            return module_name, options
+    return name, {}
+
+def _fastest_per_file():
+    """Best solver per benchmark file from results.csv and portfolio.csv."""
+    times = {}  # file --> {solver: seconds}, timeouts/errors count as TIMEOUT
+
+    if os.path.exists(RESULTS_FILE):
+        with open(RESULTS_FILE, newline="") as f:
+            for row in csv.DictReader(f):
+                for solver, value in row.items():
+                    if solver == "File" or value in (None, ""):
+                        continue  # not run with this version
+                    try:
+                        t = float(value)
+                    except ValueError:
+                        t = TIMEOUT  # "timeout" or "error"
+                    times.setdefault(row["File"], {})[solver] = t
+
+    # Total time over all files: used to break (near) ties in favour of robust solvers
+    total = {}
+    for per_solver in times.values():
+        for solver, t in per_solver.items():
+            total[solver] = total.get(solver, 0.0) + t
+
+    best = {}
+    for file_name, per_solver in times.items():
+        fastest = min(per_solver.values())
+        close = [s for s, t in per_solver.items() if t <= fastest * (1 + TIE_TOLERANCE) + TIE_SECONDS]
+        best[file_name] = min(close, key=lambda s: total[s])
+
+    # A portfolio win is one race of engines sharing the CPU, so it is only used for
+    # files that timeTest never measured
+    if os.path.exists(PORTFOLIO_FILE):
+        with open(PORTFOLIO_FILE, newline="") as f:
+            for row in csv.DictReader(f):
+                if row.get("Winner") not in (None, "", "timeout") and row["File"] not in best:
+                    best[row["File"]] = row["Winner"]
+
+    return best
+
+def train(model_path=MODEL_FILE):
+    """Recompute features for every benchmarked file and save the model (JSON)."""
+    labels = _fastest_per_file()
+    instances = []
+    for file_name in sorted(labels):
+        if not os.path.exists(os.path.join(DIMACS_FOLDER, file_name)):
+            print(f"[train] {file_name} not found in {DIMACS_FOLDER}; skipped.")
+            continue
+        feats = features(load_graph(file_name))
+        solver = labels[file_name]
+        if solver == "search5" and feats["density"] < DENSITY_THRESHOLD:
+            solver = "search4"  # below the threshold search5 just runs search4
+        instances.append({"file": file_name, "solver": solver,
+                          "features": [feats[k] for k in FEATURE_NAMES]})
+        print(f"[train] {file_name}: {solver}")
+
+    # Standardise so every feature weighs the same in the distance
+    columns = list(zip(*(inst["features"] for inst in instances))) if instances else []
+    means = [sum(col) / len(col) for col in columns]
+    stds = [math.sqrt(sum((x - m) ** 2 for x in col) / len(col)) or 1.0
+            for col, m in zip(columns, means)]
+
+    model = {"feature_names": FEATURE_NAMES, "means": means, "stds": stds,
+             "k": K_NEIGHBOURS, "instances": instances}
+    with open(model_path, "w") as f:
+        json.dump(model, f, indent=1)
+    print(f"[train] Saved {model_path} ({len(instances)} instances)")
+    return model
+
+def load_model(model_path=MODEL_FILE):
+    """Read the saved model, or None if it was never trained."""
+    if not os.path.exists(model_path):
+        return None
+    with open(model_path) as f:
+        return json.load(f)
+
+def select(feats, model):
+    """Solver name for these features (distance-weighted k-NN vote)."""
+    if not model or not model["instances"]:
+        return DEFAULT_SOLVER
+
+    x = [(feats[k] - m) / s for k, m, s in zip(model["feature_names"], model["means"], model["stds"])]
+    neighbours = sorted(
+        (math.dist(x, [(v - m) / s for v, m, s in zip(inst["features"], model["means"], model["stds"])]),
+         inst["solver"])
+        for inst in model["instances"]
+    )[:model["k"]]
+
+    votes = {}
+    for d, solver in neighbours:
+        votes[solver] = votes.get(solver, 0.0) + 1.0 / (d + 1e-9)
+    return max(votes, key=votes.get)
+
+def choose_solver(graph, model=None):
+    """
+    Pick solver and configuration for this graph.
+    Returns (name, module, options, feats, seconds spent on features).
+    """
+    start = time.time()
+    feats = features(graph)
+    name = select(feats, model if model is not None else load_model())
+    module_name, options = configuration(name)
+    return name, module_name, options, feats, time.time() - start
+
+def search_max_clique(graph):
+    """Auto mode: compute features, pick a solver, run it."""
+    _, module_name, options, _, _ = choose_solver(graph)
+    func = getattr(importlib.import_module(module_name), "search_max_clique")
+    return func(graph, **options)
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "train":
+        train()
+    elif len(sys.argv) > 1:
+        graph = load_graph(sys.argv[1])
+        name, _, _, feats, elapsed = choose_solver(graph)
+        for k in ["n", "density", "degree_variance", "degeneracy", "greedy_clique", "colour_bound"]:
+            print(f"{k:>16}: {feats[k]:.4g}" if isinstance(feats[k], float) else f"{k:>16}: {feats[k]}")
+        print(f"==> Selected solver: {name} (features took {elapsed * 1000:.1f} ms)")
+    else:
+        print("Usage: python selector.py train          # retrain from results.csv / portfolio.csv")
+        print("       python selector.py <graph_file>   # show features and the selected solver")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Automorphism orbits for symmetry breaking in the search (optional preprocessing).
+Colour refinement (1-dimensional Weisfeiler-Leman) proposes which vertices may be
+equivalent, and a small individualization-refinement search (the idea behind nauty,
+McKay & Piperno 2014) looks for an automorphism that really maps one onto the other.
+"""
+# Vertices are only put in the same orbit once an automorphism has been found, so the
+# orbits returned can be finer than the true ones (when the search budget runs out) but
+# never coarser: branching on one vertex per orbit stays exact.
+
+SEARCH_BUDGET = 200  # refinements allowed when looking for one automorphism
+
+def _sparser_side(graph):
+    """Aut(G) = Aut(complement of G): work on whichever has fewer edges."""
+    n = len(graph)
+    edges = sum(len(graph[v]) for v in graph) / 2
+    if edges <= n * (n - 1) / 4:
+        return graph
+    vertices = set(graph.keys())
+    return {v: vertices - graph[v] - {v} for v in graph}
+
+def _refine(graph, colour):
+    """
+    Colour refinement until the partition is stable.
+    New colour ids come from sorted signatures, so refining two isomorphic coloured
+    graphs gives matching ids (needed to read off the automorphism).
+    """
+    num = len(set(colour.values()))
+    while True:
+        sig = {v: (colour[v], tuple(sorted([colour[u] for u in graph[v]])))
+               for v in graph}
+        ids = {s: i for i, s in enumerate(sorted(set(sig.values())))}
+        colour = {v: ids[sig[v]] for v in graph}
+        if len(ids) == num:
+            return colour
+        num = len(ids)
+
+def _individualize(colour, v):
+    """Give v a colour of its own (-1 sorts before every refined colour)."""
+    colour = dict(colour)
+    colour[v] = -1
+    return colour
+
+def _cells(colour):
+    """Group vertices by colour."""
+    cells = {}
+    for v in sorted(colour):
+        cells.setdefault(colour[v], []).append(v)
+    return cells
+
+def _find_automorphism(graph, pi1, pi2, budget):
+    """
+    Search for an automorphism mapping the equitable colouring pi1 onto pi2.
+    Returns the mapping as a dict, or None (also when the budget runs out).
+    """
+    cells1, cells2 = _cells(pi1), _cells(pi2)
+    if {c: len(cells1[c]) for c in cells1} != {c: len(cells2[c]) for c in cells2}:
+        return None
+
+    open_cells = [c for c in cells1 if len(cells1[c]) > 1]
+    if not open_cells:
+        sigma = {cells1[c][0]: cells2[c][0] for c in cells1}
+        for v in graph:
+            if {sigma[u] for u in graph[v]} != graph[sigma[v]]:
+                return None
+        return sigma
+
+    # Branch on the smallest non-singleton cell
+    c = min(open_cells, key=lambda c: (len(cells1[c]), c))
+    left = _refine(graph, _individualize(pi1, cells1[c][0]))
+    for y in cells2[c]:
+        if budget[0] <= 0:
+            return None
+        budget[0] -= 1
+        right = _refine(graph, _individualize(pi2, y))
+        sigma = _find_automorphism(graph, left, right, budget)
+        if sigma is not None:
+            return sigma
+    return None
+
+def automorphism_orbits(graph, fixed=()):
+    """
+    Orbits of the automorphism group of the graph (of the pointwise stabilizer of the
+    vertices in 'fixed', if any).
+    Returns a dict vertex -> orbit id (the smallest vertex of its orbit).
+    """
+    g = _sparser_side(graph)
+    parent = {v: v for v in g}
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a != b:
+            if b < a:
+                a, b = b, a
+            parent[b] = a  # root is always the smallest vertex
+
+    base = {v: 0 for v in g}
+    for k, v in enumerate(fixed):
+        base[v] = -1 - k
+    base = _refine(g, base)
+
+    for cell in _cells(base).values():
+        pending = cell
+        while len(pending) > 1:
+            r = pending[0]
+            pi_r = _refine(g, _individualize(base, r))
+            for w in pending[1:]:
+                if find(w) == find(r):
+                    continue
+                sigma = _find_automorphism(g, pi_r, _refine(g, _individualize(base, w)),
+                                           [SEARCH_BUDGET])
+                if sigma is not None:
+                    # one automorphism usually merges many orbits at once
+                    for v in sigma:
+                        union(v, sigma[v])
+            pending = [w for w in pending[1:] if find(w) != find(r)]
+
+    return {v: find(v) for v in g}
@@ -1,17 +1,30 @@
 import importlib
+import inspect
 import time
 import csv
 import os
 import sys
+import tracemalloc
 from parser import parse_dimacs_graph
-import matplotlib.pyplot as plt
+from estimate import estimate
 import multiprocessing
+try:
+    import resource  # Unix only: peak RSS and the memory budget
+except ImportError:
+    resource = None
 
 # List of search versions to compare
-VERSIONS = ["search", "search2", "search3", "search4"]
+VERSIONS = ["search", "search2", "search3", "search4", "search5", "search6", "search7"]
 DIMACS_FOLDER = "../DIMACS"
 OUTPUT_FILE = "results.csv"
 PLOTS_DIR = "plots" 
+DEFAULT_TIMEOUT = 600   # seconds per version (run_version's default)
+MAX_TIMEOUT = 24 * 3600 # never wait longer than this; predicted to need more --> skip
+ESTIMATE_MARGIN = 3     # with --estimate: timeout = margin x upper end of the predicted time
+MEMORY_FILE = "memory.csv"  # one row per (file, version): peak RSS, nodes, allocations
+MEMORY_FIELDS = ["File", "Version", "Status", "Time", "PeakRSS_MB", "Nodes",
+                 "TracedPeak_MB", "BytesPerNode", "TopAllocations"]
+TOP_ALLOCATIONS = 5     # with --trace-malloc: allocation sites kept per run
 
 # johnson8-2-4.clq and p_hat300-1.clq ==> small instances
 
@@ -26,21 +39,127 @@ def load_graph(file_name):
     return graph
 
 
-def _worker(func, graph, return_dict):
-    """Internal worker that runs the search algorithm in a separate process."""
+class NodeCounter:
+    """
+    Stands in for portfolio.SharedIncumbent in the profiling run and only counts search
+    nodes (engines that take 'shared' call poll() once per node and never get a better
+    clique back). With trace=True it also adds up what each node allocates (tracemalloc
+    growth since the previous node) and keeps a snapshot from close to the peak.
+    """
+
+    def __init__(self, trace=False):
+        self.nodes = 0
+        self.trace = trace
+        self.allocated = 0
+        self.snapshot = None
+        self._last = 0
+        self._snapshot_size = 0
+
+    def poll(self):
+        self.nodes += 1
+        if self.trace:
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._last:
+                self.allocated += current - self._last
+            self._last = current
+            if current > 1.25 * self._snapshot_size:
+                # Only a handful of snapshots: each one is 25% bigger than the last
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+        return 0
+
+    def offer(self, clique):
+        pass
+
+    def best(self):
+        return []
+
+
+def _peak_rss_mb():
+    """Peak resident memory of this process in MB (None without the resource module)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _limit_memory(megabytes):
+    """
+    Cap this process's address space at its current size + 'megabytes', so a search
+    that goes over gets a MemoryError instead of taking the whole machine down.
+    """
+    if resource is None:
+        return
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * resource.getpagesize()
+    except OSError:
+        current = 0
+    limit = current + int(megabytes * 1024 * 1024)
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def _top_allocations(snapshot):
+    """The biggest allocation sites of a tracemalloc snapshot, as one string."""
+    # Leave out tracemalloc and the node counter themselves
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                       tracemalloc.Filter(False, __file__)])
+    sites = []
+    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        sites.append(f"{os.path.basename(frame.filename)}:{frame.lineno} "
+                     f"{stat.size / 1024:.0f}KiB/{stat.count}")
+    return "; ".join(sites)
+
+def _worker(func, graph, return_dict, memory_budget=None, trace=False):
+    """
+    Internal worker that runs the search algorithm in a separate process.
+    trace=True is the profiling run: node counting and tracemalloc, never timed.
+    """
+    counter = NodeCounter(trace=True) if trace else None
+    out_of_memory = False
     try:
-        result = func(graph)
+        if memory_budget is not None:
+            _limit_memory(memory_budget)
+        kwargs = {}
+        if trace:
+            if "shared" in inspect.signature(func).parameters:
+                kwargs["shared"] = counter
+            tracemalloc.start()
+        result = func(graph, **kwargs)
         return_dict["result"] = result
         return_dict["error"] = None
+    except MemoryError:
+        out_of_memory = True  # reported below, once the search's frames are freed
     except Exception as e:
         return_dict["result"] = None
         return_dict["error"] = str(e)
 
-def run_version(module_name, graph, timeout=600):
+    if out_of_memory:
+        return_dict["result"] = None
+        return_dict["error"] = "memory"
+
+    memory = {"peak_rss_mb": _peak_rss_mb()}
+    if trace:
+        snapshot = counter.snapshot or tracemalloc.take_snapshot()
+        memory["traced_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+        memory["nodes"] = counter.nodes or None
+        memory["bytes_per_node"] = counter.allocated / counter.nodes if counter.nodes else None
+        memory["top_allocations"] = _top_allocations(snapshot)
+    return_dict["memory"] = memory
+
+def run_version(module_name, graph, timeout=600, memory_budget=None, trace=False):
     """
     Runs one version of search inside a separate process.
     If it takes longer than 'timeout' seconds (default: 10 minutes),
-    it will be terminated and recorded as a timeout.
+    it will be terminated and recorded as a timeout. With 'memory_budget' (MB on top
+    of the loaded graph) a search that needs more is stopped and recorded as "memory".
+    trace=True is a profiling run instead (node counts, tracemalloc): much slower, so
+    its time must not be used as a benchmark result.
+    Returns (time or status, clique size, memory dict).
     """
     mod = importlib.import_module(module_name)
     func = getattr(mod, "search_max_clique")
@@ -48,7 +167,8 @@ def run_version(module_name, graph, timeout=600):
     manager = multiprocessing.Manager()
     return_dict = manager.dict()
 
-    p = multiprocessing.Process(target=_worker, args=(func, graph, return_dict))
+    p = multiprocessing.Process(target=_worker,
+                                args=(func, graph, return_dict, memory_budget, trace))
     start = time.time()
     p.start()
     p.join(timeout)
@@ -57,54 +177,137 @@ def run_version(module_name, graph, timeout=600):
         # Timeout happened --> kill the process
         p.terminate()
         p.join()
-        return "timeout", None 
+        return "timeout", None, {}
 
     end = time.time()
+    memory = dict(return_dict.get("memory", {}))
+
+    if return_dict.get("error") == "memory":
+        # Went over the memory budget
+        return "memory", None, memory
 
     if return_dict.get("error") is not None:
         # Error raised inside the worker
-        return "error", None
+        return "error", None, memory
 
     result = return_dict.get("result")
     if result is None:
-        return "error", None
+        return "error", None, memory
+
+    return end - start, len(result), memory
 
-    return end - start, len(result)
 
+def timeout_from_estimate(graph):
+    """
+    Timeout for this graph from the search4 runtime estimate (estimate.py), or None
+    when even the low end of the prediction is over MAX_TIMEOUT (not worth running).
+    """
+    est = estimate(graph)
+    low, high = est["seconds_ci"]
+    # Sampling-only interval: ESTIMATE_MARGIN covers the bias it leaves out
+    print(f"     ==> estimated search4 time {est['seconds']:.3g}s (95% sampling CI {low:.3g} - {high:.3g}s)")
+    if low > MAX_TIMEOUT:
+        return None
+    return min(MAX_TIMEOUT, max(DEFAULT_TIMEOUT, ESTIMATE_MARGIN * high))
 
-def test_one_graph(graph_file):
+def test_one_graph(graph_file, use_estimate=False, memory_budget=None, trace=False):
     """Runs all search versions on one graph"""
     print(f"\nTesting {graph_file}...")
     graph = load_graph(graph_file)
     results = {"File": graph_file}
 
+    timeout = DEFAULT_TIMEOUT
+    if use_estimate:
+        timeout = timeout_from_estimate(graph)
+        if timeout is None:
+            print(f"     ==> predicted to take longer than {MAX_TIMEOUT}s, skipping {graph_file}")
+            for version in VERSIONS:
+                results[version] = "skipped"
+            _append_result(results, ["File"] + VERSIONS)
+            return
+        print(f"     ==> timeout set to {timeout:.0f}s")
+
     for version in VERSIONS:
         print(f"Running {version}...")
+        memory = {}
         try:
-            t, size = run_version(version, graph)
+            t, size, memory = run_version(version, graph, timeout, memory_budget)
 
             # If timeout or error, store the string directly
             if isinstance(t, (int, float)):
                 results[version] = round(t, 3)
                 print(f"     ==> time = {t:.3f}s, clique size = {size}")
+                if trace:
+                    # Separate profiling run: only its memory numbers are kept, and
+                    # peak RSS stays the one of the timed run
+                    _, _, profile = run_version(version, graph, timeout, memory_budget, trace=True)
+                    profile.pop("peak_rss_mb", None)
+                    memory.update(profile)
             else:
-                results[version] = t  # "timeout" or "error"
+                results[version] = t  # "timeout", "memory" or "error"
                 print(f"     ==> time = {t}, clique size = {size}")
 
         except Exception as e:
             print(f"     ==> error running {version}: {e}")
             results[version] = "error"
 
+        _append_result(_memory_row(graph_file, version, results[version], memory),
+                       MEMORY_FIELDS, MEMORY_FILE)
+
     # Write to CSV
-    write_header = not os.path.exists(OUTPUT_FILE)
-    with open(OUTPUT_FILE, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["File"] + VERSIONS)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(results)
+    _append_result(results, ["File"] + VERSIONS)
 
     print(f"Saved results for {graph_file}")
 
+def _memory_row(graph_file, version, outcome, memory):
+    """One memory.csv row; prints the numbers it has."""
+    row = {"File": graph_file, "Version": version,
+           "Status": "ok" if isinstance(outcome, float) else outcome,
+           "Time": outcome if isinstance(outcome, float) else ""}
+    for field, key, digits in [("PeakRSS_MB", "peak_rss_mb", 1), ("Nodes", "nodes", 0),
+                               ("TracedPeak_MB", "traced_peak_mb", 2),
+                               ("BytesPerNode", "bytes_per_node", 0)]:
+        value = memory.get(key)
+        row[field] = "" if value is None else round(value, digits) if digits else int(value)
+    row["TopAllocations"] = memory.get("top_allocations", "")
+
+    if row["PeakRSS_MB"] != "":
+        line = f"     ==> peak RSS = {row['PeakRSS_MB']} MB"
+        if row["Nodes"] != "":
+            line += f", nodes = {row['Nodes']}"
+        if row["BytesPerNode"] != "":
+            line += f", {row['BytesPerNode']} bytes allocated per node"
+        print(line)
+    if row["TopAllocations"]:
+        print(f"     ==> top allocations: {row['TopAllocations']}")
+    return row
+
+def _append_result(row, fieldnames, csv_path=OUTPUT_FILE):
+    """Append one row to the CSV, widening the header if new versions were added."""
+    if os.path.exists(csv_path):
+        with open(csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            old_fields = reader.fieldnames or []
+            old_rows = list(reader)
+        missing = [c for c in fieldnames if c not in old_fields]
+        if missing:
+            # Rewrite the file once with the extra columns (old rows get them empty)
+            all_fields = old_fields + missing
+            with open(csv_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=all_fields)
+                writer.writeheader()
+                writer.writerows(old_rows)
+        fieldnames = old_fields + missing
+        write_header = False
+    else:
+        write_header = True
+
+    with open(csv_path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if write_header:
+            writer.writeheader()
+        writer.writerow(row)
+
 # Code for generating plots from results.csv
 def _safe_float(v):
     try:
@@ -118,6 +321,8 @@ def _ensure_plots_dir():
 
 def generate_plots_from_csv(csv_path=OUTPUT_FILE):
     """Reads results.csv and generates PNG plots into plots/"""
+    import matplotlib.pyplot as plt  # only needed here; keeps the benchmark itself light
+
     if not os.path.exists(csv_path):
         print(f"[plot] No CSV found at {csv_path}; skipping plots.")
         return
@@ -189,11 +394,30 @@ def generate_plots_from_csv(csv_path=OUTPUT_FILE):
         print("[plot] No valid numeric data to compute averages.")
 # ------------- End of plot code -------------
 
-def main():
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else list(argv)
+    # --estimate: predict the runtime first, then lengthen the timeout or skip the graph
+    use_estimate = "--estimate" in args
+    # --trace-malloc: run under tracemalloc (slower) to record allocation sites per node
+    trace = "--trace-malloc" in args
+    args = [a for a in args if a not in ("--estimate", "--trace-malloc")]
+    # --memory-budget MB: stop a version once it needs MB more than the loaded graph
+    memory_budget = None
+    if "--memory-budget" in args:
+        i = args.index("--memory-budget")
+        memory_budget = float(args[i + 1])
+        del args[i:i + 2]
+
+    # A folder inside DIMACS (e.g. a generator.py sweep): test every graph in it
+    if args and os.path.isdir(os.path.join(DIMACS_FOLDER, args[0])):
+        folder = args[0]
+        graphs = sorted(f for f in os.listdir(os.path.join(DIMACS_FOLDER, folder)) if f.endswith(".clq"))
+        for g in graphs:
+            test_one_graph(os.path.join(folder, g), use_estimate, memory_budget, trace)
     # If a specific graph is given, test just that one
-    if len(sys.argv) > 1:
-        file_name = sys.argv[1]
-        test_one_graph(file_name)
+    elif args:
+        file_name = args[0]
+        test_one_graph(file_name, use_estimate, memory_budget, trace)
     else:
         # Otherwise, test all .clq files in DIMACS folder
         print("No file given, testing all .clq graphs in DIMACS...\n")
@@ -205,7 +429,7 @@ def main():
             sys.exit(1)
 
         for g in graphs:
-            test_one_graph(g)
+            test_one_graph(g, use_estimate, memory_budget, trace)
             
         print("\nGenerating plots...")
         generate_plots_from_csv(OUTPUT_FILE)